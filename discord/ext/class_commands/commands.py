@@ -24,7 +24,9 @@ DEALINGS IN THE SOFTWARE.
 
 from __future__ import annotations
 
+import asyncio
 import inspect
+import sys
 import traceback
 from types import FunctionType
 
@@ -38,6 +40,7 @@ from typing import (
     Union,
     Sequence,
     Generic,
+    Tuple,
 )
 from discord import AppCommandType, Interaction, Member, Message, User
 from discord.app_commands.commands import _shorten, Command as _Command, ContextMenu
@@ -55,6 +58,9 @@ __all__ = ('UserCommand', 'MessageCommand', 'SlashCommand', 'Option')
 
 CommandT = TypeVar('CommandT', bound='Command')
 _empty = inspect.Parameter.empty
+_POSITIONAL_OR_KEYWORD = inspect.Parameter.POSITIONAL_OR_KEYWORD
+_SKIP_TYPES = (FunctionType, classmethod, staticmethod)
+_CTX_MENU_TYPES = frozenset({AppCommandType.user, AppCommandType.message})
 
 if TYPE_CHECKING:
 
@@ -107,21 +113,26 @@ else:
             autocomplete: bool = False,
             choices: List[Choice[ChoiceT]] = MISSING,
         ) -> None:
-            self.description = description
-            self.default = default
             self.autocomplete = autocomplete
+            self.default = default
+            self.description = description
             self.name = name
             self.choices = choices
 
 
 class ParameterData(inspect.Parameter):
-    def __init__(self, name: str, default: Any = MISSING, annotation: Any = MISSING):
-        super().__init__(
-            name,
-            inspect.Parameter.POSITIONAL_OR_KEYWORD,
-            default=default if default is not MISSING else _empty,
-            annotation=annotation if annotation is not MISSING else _empty,
-        )
+    __slots__ = ()
+
+    @classmethod
+    def _make(cls, name: str, default: Any = MISSING, annotation: Any = MISSING) -> ParameterData:
+        # The name is always a valid identifier since it comes from the class body,
+        # so skip the validation done in inspect.Parameter.__init__
+        self = cls.__new__(cls)
+        self._name = name
+        self._kind = _POSITIONAL_OR_KEYWORD
+        self._default = _empty if default is MISSING else default
+        self._annotation = _empty if annotation is MISSING else annotation
+        return self
 
 
 class _CommandMeta(type):
@@ -160,8 +171,10 @@ class _CommandMeta(type):
         autocompleted = []
 
         annotations = attrs.get('__annotations__', {})
+        make_parameter = ParameterData._make
+        append_argument = arguments.append
         for k, v in attrs.items():
-            if k.startswith('_') or k == 'interaction' or type(v) in {FunctionType, classmethod, staticmethod}:
+            if k[0] == '_' or k == 'interaction' or isinstance(v, _SKIP_TYPES):
                 continue
 
             annotation = annotations.get(k, 'str')
@@ -176,9 +189,10 @@ class _CommandMeta(type):
             elif v is not MISSING:
                 default = v
 
-            arguments.append(ParameterData(k, default, annotation))
+            append_argument(make_parameter(k, default, annotation))
             if _name is not MISSING:
-                renames[k] = _name
+                # locale_str renames can't be interned
+                renames[k] = sys.intern(_name) if type(_name) is str else _name
             if description is not MISSING:
                 descriptions[k] = description
             if choices is not MISSING:
@@ -186,8 +200,15 @@ class _CommandMeta(type):
             if autocomplete:
                 autocompleted.append(k)
 
-        if type in {AppCommandType.user, AppCommandType.message} and len(arguments) > 1:
-            raise TypeError('Context menu commands must take exactly one argument')
+        # Mixins don't have a type, so keep looking until one of the bases does
+        cmd_type = attrs.get('__discord_app_commands_type__', MISSING)
+        if cmd_type is MISSING:
+            for base in bases:
+                cmd_type = getattr(base, '__discord_app_commands_type__', MISSING)
+                if cmd_type is not None and cmd_type is not MISSING:
+                    break
+        if cmd_type in _CTX_MENU_TYPES and arguments:
+            raise TypeError('Context menu commands cannot declare parameters')
 
         if renames:
             attrs['__discord_app_commands_param_rename__'] = renames
@@ -198,6 +219,18 @@ class _CommandMeta(type):
         if autocompleted:
             attrs['__discord_app_commands_param_autocompleted__'] = autocompleted
 
+        # Parameters are stored on the instance, so they become slots rather than class attributes.
+        # Their defaults stay reachable through the parameter table. interaction and target are already
+        # slots of the base classes, and context menus can't declare parameters so they get no new slots.
+        for p in arguments:
+            del attrs[p.name]
+        attrs['__slots__'] = tuple(p.name for p in arguments)
+
+        # Flattened view of the above so the parameter injection only has to walk a single tuple
+        attrs['__discord_app_commands_param_table__'] = tuple(
+            (p, renames.get(p.name, MISSING), descriptions.get(p.name, MISSING)) for p in arguments
+        )
+
         # After all of that, we turn the class into a Command
         sub = super().__new__(cls, classname, bases, attrs)
 
@@ -239,6 +272,7 @@ class CommandMeta(meta, type):
     if TYPE_CHECKING:
         __discord_app_commands_type__: AppCommandType
         __discord_app_commands_params__: List[ParameterData]
+        __discord_app_commands_param_table__: Tuple[Tuple[ParameterData, Any, Any], ...]
         __discord_app_commands_param_description__: Dict[str, str]
         __discord_app_commands_param_rename__: Dict[str, str]
         __discord_app_commands_param_choices__: Dict[str, List[Choice]]
@@ -277,12 +311,17 @@ class Command(metaclass=CommandMeta):
         This means that relying on the state of this class to be
         the same between command invocations would not work as expected.
 
+        Command classes use ``__slots__`` made up of their parameters, so
+        assigning arbitrary attributes on an instance is not supported.
+
     Attributes
     -----------
     interaction: :class:`~discord.Interaction`
         The interaction that triggered the command.
     """
 
+    __slots__ = ('interaction',)
+
     interaction: Interaction
 
     async def callback(self) -> None:
@@ -303,13 +342,22 @@ class Command(metaclass=CommandMeta):
         overridden to have a different implementation.
 
         :attr:`interaction` and :attr:`id` will be available at this point.
+        Parameters hold their default value, or :data:`~discord.utils.MISSING`
+        if they are required.
 
         Parameters
         -----------
         exception: :class:`~discord.app_commands.AppCommandError`
             The exception that was thrown.
         """
-        traceback.print_exception(type(exception), exception, exception.__traceback__)
+        # Formatting the traceback walks every frame, so keep it off the event loop when possible.
+        # The result is written in a single call so concurrent errors don't interleave.
+        args = (type(exception), exception, exception.__traceback__)
+        try:
+            lines = await asyncio.get_running_loop().run_in_executor(None, traceback.format_exception, *args)
+        except RuntimeError:  # The default executor has been shut down
+            lines = traceback.format_exception(*args)
+        sys.stderr.write(''.join(lines))
 
     async def send(
         self,
@@ -404,24 +452,40 @@ class Command(metaclass=CommandMeta):
                 suppress_embeds=suppress_embeds,
             )
 
-        # Convert the kwargs from None to MISSING to appease the remaining implementations
-        kwargs = {
-            'content': content,
-            'tts': tts,
-            'embed': MISSING if embed is None else embed,
-            'embeds': MISSING if embeds is None else embeds,
-            'file': MISSING if file is None else file,
-            'files': MISSING if files is None else files,
-            'allowed_mentions': MISSING if allowed_mentions is None else allowed_mentions,
-            'view': MISSING if view is None else view,
-            'suppress_embeds': suppress_embeds,
-            'ephemeral': ephemeral,
-        }
-
-        if interaction.response.is_done():
+        response = interaction.response
+
+        # Most responses are plain text, so skip building the kwargs entirely in that case
+        if (
+            embed is None
+            and embeds is None
+            and file is None
+            and files is None
+            and allowed_mentions is None
+            and view is None
+            and not response.is_done()
+        ):
+            await response.send_message(content=content, tts=tts, suppress_embeds=suppress_embeds, ephemeral=ephemeral)
+            return await interaction.original_message()
+
+        # Only pass what was given, the remaining implementations default everything else to MISSING
+        kwargs: Dict[str, Any] = {'content': content, 'tts': tts, 'suppress_embeds': suppress_embeds, 'ephemeral': ephemeral}
+        if embed is not None:
+            kwargs['embed'] = embed
+        if embeds is not None:
+            kwargs['embeds'] = embeds
+        if file is not None:
+            kwargs['file'] = file
+        if files is not None:
+            kwargs['files'] = files
+        if allowed_mentions is not None:
+            kwargs['allowed_mentions'] = allowed_mentions
+        if view is not None:
+            kwargs['view'] = view
+
+        if response.is_done():
             return await interaction.followup.send(**kwargs, wait=True)
 
-        await interaction.response.send_message(**kwargs)
+        await response.send_message(**kwargs)
         return await interaction.original_message()
 
     async def defer(self, *, ephemeral: bool = False) -> None:
@@ -458,6 +522,8 @@ class SlashCommand(Command, Generic[CommandT]):
         the same between command invocations would not work as expected.
     """
 
+    __slots__ = ()
+
     __discord_app_commands_type__ = AppCommandType.chat_input
 
     async def autocomplete(self, focused: str) -> List[Choice[ChoiceT]]:
@@ -504,6 +570,8 @@ class UserCommand(Command, Generic[CommandT]):
         The user that the command is executed on.
     """
 
+    __slots__ = ('target',)
+
     __discord_app_commands_type__ = AppCommandType.user
     target: Union[Member, User]
 
@@ -524,5 +592,7 @@ class MessageCommand(Command, Generic[CommandT]):
         The message that the command is executed on.
     """
 
+    __slots__ = ('target',)
+
     __discord_app_commands_type__ = AppCommandType.message
     target: Message
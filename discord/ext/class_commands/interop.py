@@ -25,7 +25,7 @@ DEALINGS IN THE SOFTWARE.
 from __future__ import annotations
 
 import sys
-from typing import TYPE_CHECKING, Any, List, Type, TypeVar, Union
+from typing import TYPE_CHECKING, Any, Dict, List, Tuple, Type, TypeVar, Union
 
 from discord import AppCommandType, Member, Message, User
 from discord.app_commands.commands import (
@@ -83,7 +83,8 @@ def _generate_callback(cls: Type[_Command], fake: bool = False) -> Any:
         async def slash_callback(interaction: Interaction, **params) -> None:
             inst = cls()
             inst.interaction = interaction
-            inst.__dict__.update(params)
+            for k, v in params.items():
+                setattr(inst, k, v)
             await inst.callback()
 
         callback = slash_callback
@@ -98,10 +99,22 @@ def _inject_callback(cls: Type[_Command], command: AppCommand) -> None:
     command._callback = _generate_callback(cls)
 
 
+def _param_defaults(cls: Type[_Command]) -> Tuple[Tuple[str, Any], ...]:
+    # Parameters are slots, so instances that aren't built from a full invocation need every one of them
+    # filled in to mirror the old class attribute fallback. Required parameters have no default and use MISSING.
+    return tuple(
+        (p.name, MISSING if p.default is p.empty else p.default) for p, _, _ in cls.__discord_app_commands_param_table__
+    )
+
+
 def _inject_error_handler(cls: Type[_Command], command: AppCommand) -> None:
+    defaults = _param_defaults(cls)
+
     async def on_error(interaction: Interaction, error: AppCommandError) -> None:
         inst = cls()
         inst.interaction = interaction
+        for k, v in defaults:
+            setattr(inst, k, v)
         return await inst.on_error(error)
 
     command.on_error = on_error
@@ -112,39 +125,40 @@ def _inject_parameters(cls: Type[_Command], command: AppCommand) -> None:
     if isinstance(command, ContextMenu):
         return
 
-    params = cls.__discord_app_commands_params__
     cache = {}
     globalns = vars(sys.modules[cls.__module__])  # I don't want to talk about it
 
     parameters: List[CommandParameter] = []
-    for parameter in params:
+    renames: Dict[str, str] = {}
+    descriptions: Dict[str, str] = {}
+    for parameter, rename, description in cls.__discord_app_commands_param_table__:
         if parameter.annotation is parameter.empty:
             raise TypeError(f'Annotation for {parameter.name} must be given in comm {cls.__qualname__!r}')
 
         resolved = resolve_annotation(parameter.annotation, globalns, globalns, cache)
         param = annotation_to_parameter(resolved, parameter)
         parameters.append(param)
+        if rename is not MISSING:
+            renames[parameter.name] = rename
+        if description is not MISSING:
+            descriptions[parameter.name] = description
 
     values = sorted(parameters, key=lambda a: a.required, reverse=True)
     result = {v.name: v for v in values}
 
-    descriptions = _parse_args_from_docstring(cls, result)
+    parsed = _parse_args_from_docstring(cls, result)
 
-    try:
-        descriptions.update(cls.__discord_app_commands_param_description__)
-    except AttributeError:
+    if descriptions:
+        parsed.update(descriptions)
+    else:
         for param in values:
             if param.description is MISSING:
                 param.description = '…'
-    if descriptions:
-        _populate_descriptions(result, descriptions)
+    if parsed:
+        _populate_descriptions(result, parsed)
 
-    try:
-        renames = cls.__discord_app_commands_param_rename__
-    except AttributeError:
-        pass
-    else:
-        _populate_renames(result, renames.copy())
+    if renames:
+        _populate_renames(result, renames)
 
     try:
         choices = cls.__discord_app_commands_param_choices__
@@ -172,15 +186,26 @@ def _inject_autocomplete(cls: Type[_Command], command: AppCommand) -> None:
     except AttributeError:
         return
 
+    # The namespace is keyed by the Discord facing name, which differs from the attribute name when renamed
+    attribute_names = {rename: p.name for p, rename, _ in cls.__discord_app_commands_param_table__ if rename is not MISSING}
+    defaults = _param_defaults(cls)
+
     async def autocomplete(interaction: Interaction, current: Any) -> List[Choice]:
         inst = cls()
         inst.interaction = interaction
-        inst.__dict__.update(interaction.namespace.__dict__)
-
-        for k, v in inst.__dict__.items():
-            if v == current:
-                return await inst.autocomplete(k)  # type: ignore # Only slash commands can have autocomplete
-        return []
+        for k, v in defaults:
+            setattr(inst, k, v)
+
+        focused = MISSING
+        for k, v in interaction.namespace.__dict__.items():
+            k = attribute_names.get(k, k)
+            setattr(inst, k, v)
+            if focused is MISSING and v == current:
+                focused = k
+
+        if focused is MISSING:
+            return []
+        return await inst.autocomplete(focused)  # type: ignore # Only slash commands can have autocomplete
 
     _populate_autocomplete(command._params, {k: autocomplete for k in autocompleted})
 